@@ -1,173 +1,572 @@
 import os
-import requests
+import argparse
+import getpass
+import re
+import sys
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import aiohttp
+import orjson
 from datetime import datetime
 import json
+from email.utils import formatdate
+
+logger = logging.getLogger(__name__)
+
+# Only advertise brotli when the decoder is importable, otherwise aiohttp
+# cannot decompress a br response it asked for
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Transient statuses worth retrying, mirroring a typical urllib3 Retry setup
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+# Page size for the meetings list query
+PAGE_SIZE = 50
+
+MEETINGS_QUERY = """
+query GetTranscripts($fromDate: DateTime, $toDate: DateTime, $limit: Int, $skip: Int) {
+    transcripts(fromDate: $fromDate, toDate: $toDate, limit: $limit, skip: $skip) {
+        id
+        title
+        date
+        duration
+        transcript_url
+        audio_url
+        summary {
+            keywords
+            action_items
+        }
+    }
+}
+"""
+
+# Full selection set for the standalone single-transcript lookup
+TRANSCRIPT_FIELDS = """
+id
+title
+date
+duration
+transcript_url
+audio_url
+sentences {
+    text
+    speaker_id
+    start_time
+}
+summary {
+    keywords
+    action_items
+}
+"""
+
+TRANSCRIPT_QUERY = f"""
+query Transcript($transcriptId: String!) {{
+    transcript(id: $transcriptId) {{ {TRANSCRIPT_FIELDS} }}
+}}
+"""
+
+# The batch path only needs what the list query didn't already return:
+# the sentences. Everything else is merged back in from the meeting entry.
+TRANSCRIPT_SENTENCE_FIELDS = """
+id
+sentences {
+    text
+    speaker_id
+    start_time
+}
+"""
+
+# How many aliased transcript lookups to pack into one GraphQL document
+BATCH_SIZE = 25
+
+# Characters that are illegal in filenames on Windows (a superset of the
+# POSIX restrictions), plus control characters
+_ILLEGAL_PATH_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+def _sanitize(title):
+    """Make a meeting title safe to use as a directory name"""
+    return _ILLEGAL_PATH_CHARS.sub('-', title).strip().rstrip('.')
+
+# Marks a transcript whose fetch errored, as opposed to one the API
+# reports as genuinely absent (None) — failed meetings must stay pending
+_FETCH_FAILED = object()
 
 class FirefliesDownloader:
-    def __init__(self, api_key):
+    def __init__(self, api_key, max_concurrency=8, use_cache=True):
         self.api_key = api_key
         self.base_url = "https://api.fireflies.ai/graphql"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-    def fetch_meetings(self, start_date=None, end_date=None):
-        query = """
-        query GetTranscripts($fromDate: DateTime, $toDate: DateTime, $limit: Int) {
-            transcripts(fromDate: $fromDate, toDate: $toDate, limit: $limit) {
-                id
-                title
-                date
-                duration
-                transcript_url
-                audio_url
-                summary {
-                    keywords
-                    action_items
-                }
-            }
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING
         }
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self.use_cache = use_cache
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "fireflies")
+        self._inflight = {}
+        self._query_hashes = {}
+        self._apq_supported = True
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._dirs_created = set()
+        self.session = None
+
+    def _ensure_dir(self, path):
+        """makedirs, skipping the syscalls for directories already created"""
+        if path and path not in self._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            self._dirs_created.add(path)
+
+    @staticmethod
+    def _query_key(query, variables):
+        """Stable digest identifying a query + variables pair"""
+        return hashlib.md5(
+            json.dumps({"q": query, "v": variables}, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+
+    def _cache_path(self, query, variables):
+        """Path of the on-disk cache entry for a query + variables pair"""
+        return os.path.join(self.cache_dir, f"{self._query_key(query, variables)}.json")
+
+    def _cache_get(self, query, variables):
+        """Return a cached response, or None on miss / disabled cache"""
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(query, variables), 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _cache_put(self, query, variables, result):
+        """Persist a response so reruns skip the network roundtrip"""
+        if not self.use_cache:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_path(query, variables), 'wb') as f:
+                f.write(orjson.dumps(result))
+        except OSError as e:
+            logger.warning("Could not write cache entry: %s", e)
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.max_concurrency
+        )
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            auto_decompress=True,
+            json_serialize=lambda obj: orjson.dumps(obj).decode('utf-8')
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self._io_pool.shutdown(wait=True)
+
+    async def _request(self, method, url, **kwargs):
+        """Issue a request on the shared session, retrying transient failures"""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except aiohttp.ClientError:
+                if attempt >= MAX_RETRIES:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                    return response
+                response.release()
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+    async def _post_payload(self, payload):
+        """POST one GraphQL payload and return the parsed response, or None"""
+        async with self._sem:
+            response = await self._request("POST", self.base_url, json=payload)
+            async with response:
+                if response.status == 400:
+                    error_detail = await response.json(loads=orjson.loads)
+                    logger.error(
+                        "API Error Details: status=%s body=%s",
+                        response.status,
+                        json.dumps(error_detail, indent=2)
+                    )
+                    return None
+
+                response.raise_for_status()
+                return await response.json(loads=orjson.loads)
+
+    @staticmethod
+    def _persisted_query_missing(data):
+        """True if the server rejected a persisted-query hash it has not seen"""
+        return any(
+            error.get("message") == "PersistedQueryNotFound"
+            or (error.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+            for error in data.get("errors", [])
+        )
+
+    @staticmethod
+    def _persisted_query_unsupported(data):
+        """True if the server says it does not implement persisted queries"""
+        return any(
+            error.get("message") == "PersistedQueryNotSupported"
+            or (error.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_SUPPORTED"
+            for error in data.get("errors", [])
+        )
+
+    async def _post_graphql(self, query, variables):
+        """POST a GraphQL operation, preferring Apollo-style persisted queries
+
+        Sends only the document's sha256 hash first so the server can skip
+        parsing/validating the query body; if the hash is unknown
+        (PersistedQueryNotFound) retries once with the full document to
+        register it. A server without APQ answers the hash-only POST with a
+        400 or PersistedQueryNotSupported — either way the call falls back
+        to a plain query and hash-only payloads are disabled for the rest of
+        the session. Returns the parsed response dict, or None on a 400.
         """
-        
+        if not self._apq_supported:
+            return await self._post_payload({"query": query, "variables": variables})
+
+        sha = self._query_hashes.get(query)
+        if sha is None:
+            sha = hashlib.sha256(query.encode('utf-8')).hexdigest()
+            self._query_hashes[query] = sha
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha}}
+
+        data = await self._post_payload({"variables": variables, "extensions": extensions})
+        if data is None:
+            # e.g. "Must provide query string": the server choked on a
+            # body with no query, so stop sending hash-only payloads
+            logger.warning("Server rejected hash-only request; disabling persisted queries")
+            self._apq_supported = False
+            return await self._post_payload({"query": query, "variables": variables})
+
+        if self._persisted_query_unsupported(data):
+            logger.warning("Server does not support persisted queries; disabling them")
+            self._apq_supported = False
+            return await self._post_payload({"query": query, "variables": variables})
+
+        if self._persisted_query_missing(data):
+            data = await self._post_payload(
+                {"query": query, "variables": variables, "extensions": extensions}
+            )
+        return data
+
+    async def fetch_meetings(self, start_date=None, end_date=None):
         # Convert dates to ISO format for DateTime
         if start_date:
             start_date = f"{start_date}T00:00:00Z"
         if end_date:
             end_date = f"{end_date}T23:59:59Z"
-            
+
+        # Page through the full range instead of stopping at the first
+        # PAGE_SIZE meetings; a short page marks the end
+        meetings = []
+        skip = 0
+        while True:
+            page = await self._fetch_meetings_page(start_date, end_date, skip)
+            if page is None:
+                break
+            meetings.extend(page)
+            if len(page) < PAGE_SIZE:
+                break
+            skip += PAGE_SIZE
+        return meetings
+
+    async def _fetch_meetings_page(self, start_date, end_date, skip):
+        """Fetch one page of the meetings list, or None on error"""
         variables = {
-            "limit": 50,
+            "limit": PAGE_SIZE,
+            "skip": skip,
             "fromDate": start_date,
             "toDate": end_date
         }
-        
+
         try:
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json={"query": query, "variables": variables}
-            )
-            
-            if response.status_code == 400:
-                error_detail = response.json()
-                print(f"API Error Details:")
-                print(f"Status Code: {response.status_code}")
-                print(f"Response Body: {json.dumps(error_detail, indent=2)}")
-                return []
-                
-            response.raise_for_status()
-            data = response.json()
-            
+            data = await self._post_graphql(MEETINGS_QUERY, variables)
+            if data is None:
+                return None
+
             if "errors" in data:
-                print(f"GraphQL Errors: {json.dumps(data['errors'], indent=2)}")
-                return []
-            
-            print(f"API Response: {json.dumps(data, indent=2)}")
+                logger.error("GraphQL Errors: %s", json.dumps(data['errors'], indent=2))
+                return None
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API Response: %s", json.dumps(data, indent=2))
             return data.get("data", {}).get("transcripts", [])
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Network Error: {str(e)}")
-            return []
+
+        except aiohttp.ClientError as e:
+            logger.error("Network Error: %s", e)
+            return None
         except json.JSONDecodeError:
-            print(f"Invalid JSON response: {response.text}")
-            return []
+            logger.error("Invalid JSON response")
+            return None
         except KeyError as e:
-            print(f"Unexpected response structure: {str(e)}")
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
-            return []
+            logger.error("Unexpected response structure: %s", e)
+            return None
 
-    def get_transcript(self, transcript_id):
+    async def get_transcript(self, transcript_id):
         """Fetch a specific transcript by ID"""
-        query = """
-        query Transcript($transcriptId: String!) {
-            transcript(id: $transcriptId) {
-                id
-                title
-                date
-                duration
-                transcript_url
-                audio_url
-                sentences {
-                    text
-                    speaker_id
-                    start_time
-                }
-                summary {
-                    keywords
-                    action_items
-                }
-            }
-        }
-        """
-        
+        query = TRANSCRIPT_QUERY
         variables = {
             "transcriptId": transcript_id
         }
-        
+
+        cached = self._cache_get(query, variables)
+        if cached is not None:
+            return cached
+
+        # Deduplicate concurrent identical requests: later callers await the
+        # future of the one already in flight instead of issuing a second POST
+        key = self._query_key(query, variables)
+        if key in self._inflight:
+            return await self._inflight[key]
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
         try:
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json={"query": query, "variables": variables}
-            )
-            
-            if response.status_code == 400:
-                error_detail = response.json()
-                print(f"API Error Details:")
-                print(f"Status Code: {response.status_code}")
-                print(f"Response Body: {json.dumps(error_detail, indent=2)}")
+            transcript = await self._fetch_transcript(query, variables)
+            fut.set_result(transcript)
+            return transcript
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _fetch_transcript(self, query, variables):
+        """Issue the transcript GraphQL query and cache the result"""
+        try:
+            data = await self._post_graphql(query, variables)
+            if data is None:
                 return None
-                
-            response.raise_for_status()
-            data = response.json()
-            
+
             if "errors" in data:
-                print(f"GraphQL Errors: {json.dumps(data['errors'], indent=2)}")
+                logger.error("GraphQL Errors: %s", json.dumps(data['errors'], indent=2))
                 return None
-            
-            return data.get("data", {}).get("transcript")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Network Error: {str(e)}")
+
+            transcript = data.get("data", {}).get("transcript")
+            if transcript:
+                self._cache_put(query, variables, transcript)
+            return transcript
+
+        except aiohttp.ClientError as e:
+            logger.error("Network Error: %s", e)
             return None
         except json.JSONDecodeError:
-            print(f"Invalid JSON response: {response.text}")
+            logger.error("Invalid JSON response")
             return None
         except KeyError as e:
-            print(f"Unexpected response structure: {str(e)}")
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
+            logger.error("Unexpected response structure: %s", e)
             return None
 
-    def download_file(self, url, filename):
-        """Generic file download function"""
+    async def get_transcripts(self, transcript_ids):
+        """Fetch transcript sentences, batching cache misses into aliased queries
+
+        Only the sentences are requested — the caller already holds the other
+        fields from the list query. Returns a dict mapping transcript id to
+        the fetched data (missing or failed ids are simply absent).
+        """
+        results = {}
+        missing = []
+        # Pagination overlap can hand us the same id twice; fetch each once
+        for transcript_id in dict.fromkeys(transcript_ids):
+            cached = self._cache_get(TRANSCRIPT_SENTENCE_FIELDS, {"transcriptId": transcript_id})
+            if cached is not None:
+                results[transcript_id] = cached
+            else:
+                missing.append(transcript_id)
+
+        if missing:
+            chunks = [missing[i:i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+            for fetched in await asyncio.gather(
+                *(self._fetch_transcript_batch(chunk) for chunk in chunks)
+            ):
+                results.update(fetched)
+
+        return results
+
+    async def _fetch_transcript_batch(self, transcript_ids):
+        """Fetch a chunk of transcripts in a single aliased GraphQL POST"""
+        arg_defs = ", ".join(f"$id{i}: String!" for i in range(len(transcript_ids)))
+        selections = " ".join(
+            f"t{i}: transcript(id: $id{i}) {{ {TRANSCRIPT_SENTENCE_FIELDS} }}"
+            for i in range(len(transcript_ids))
+        )
+        query = f"query BatchTranscripts({arg_defs}) {{ {selections} }}"
+        variables = {f"id{i}": tid for i, tid in enumerate(transcript_ids)}
+
+        try:
+            data = await self._post_graphql(query, variables)
+            if data is None:
+                return {}
+
+            # GraphQL returns partial results: a failed alias comes back null
+            # alongside errors while the rest of the batch is still usable,
+            # so log the errors but keep harvesting
+            if "errors" in data:
+                logger.error("GraphQL Errors: %s", json.dumps(data['errors'], indent=2))
+
+            results = {}
+            has_errors = "errors" in data
+            payload = data.get("data") or {}
+            for i, transcript_id in enumerate(transcript_ids):
+                transcript = payload.get(f"t{i}")
+                if transcript:
+                    results[transcript_id] = transcript
+                    self._cache_put(
+                        TRANSCRIPT_SENTENCE_FIELDS, {"transcriptId": transcript_id}, transcript
+                    )
+                elif not has_errors:
+                    # null alias with no errors: the API says this meeting
+                    # genuinely has no transcript. With errors present a
+                    # null alias may just have failed, so leave it absent
+                    # and let the caller treat it as a fetch failure
+                    results[transcript_id] = None
+            return results
+
+        except aiohttp.ClientError as e:
+            logger.error("Network Error: %s", e)
+            return {}
+        except json.JSONDecodeError:
+            logger.error("Invalid JSON response")
+            return {}
+
+    async def download_to_file(self, url, path):
+        """Stream a file from URL directly to disk, one chunk at a time
+
+        If the file already exists locally, a conditional GET is sent so an
+        unchanged remote file (304) skips the transfer entirely.
+        """
         if not url:
-            print(f"No URL provided for {filename}")
-            return None
-            
+            print(f"No URL provided for {path}")
+            return False
+
+        headers = {}
+        etag_path = f"{path}.etag"
+        if os.path.exists(path):
+            headers["If-Modified-Since"] = formatdate(os.path.getmtime(path), usegmt=True)
+            try:
+                with open(etag_path, 'r', encoding='utf-8') as f:
+                    headers["If-None-Match"] = f.read().strip()
+            except OSError:
+                pass
+
+        # Stream into a temp name and rename onto the target only once the
+        # body completed, so a dropped connection never leaves a truncated
+        # file where a finished download is expected
+        part_path = f"{path}.part"
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.RequestException as e:
-            print(f"Error downloading {filename}: {str(e)}")
-            print(f"URL: {url}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            return None
+            async with self._sem:
+                response = await self._request("GET", url, headers=headers)
+                async with response:
+                    if response.status == 304:
+                        print(f"Unchanged, skipping: {path}")
+                        return True
 
-    def save_file(self, content, filename):
-        """Save content to file, creating directories if needed"""
-        if content:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, 'wb') as f:
-                f.write(content)
-            print(f"Saved: {filename}")
-        else:
-            print(f"No content to save for: {filename}")
+                    response.raise_for_status()
+                    self._ensure_dir(os.path.dirname(path))
+                    with open(part_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(65536):
+                            f.write(chunk)
+                    os.replace(part_path, path)
+
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        with open(etag_path, 'w', encoding='utf-8') as f:
+                            f.write(etag)
+            print(f"Saved: {path}")
+            return True
+        except aiohttp.ClientError as e:
+            logger.error("Error downloading %s: %s (URL: %s)", path, e, url)
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            return False
+
+    async def save_json(self, obj, filename):
+        """Serialize obj and write it in the I/O thread pool
+
+        Serializing in the worker thread keeps the encode off the event loop
+        and writes orjson's bytes straight to the file with no intermediate
+        str or extra copy.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self._io_pool, self._save_json_sync, obj, filename
+        )
+
+    def _save_json_sync(self, obj, filename):
+        self._ensure_dir(os.path.dirname(filename))
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        print(f"Saved: {filename}")
+
+    async def _process_meeting(self, meeting, meeting_dir, transcript_data):
+        """Save transcript, audio and metadata for one meeting
+
+        transcript_data is the fetched sentences dict, None when the API says
+        the meeting has no transcript, or _FETCH_FAILED when the fetch
+        errored and the meeting must stay pending for the next run.
+        """
+        if transcript_data is not None and transcript_data is not _FETCH_FAILED:
+            # The batch query only fetched sentences; merge them with the
+            # fields already known from the list query
+            full_transcript = {
+                "id": meeting["id"],
+                "title": meeting["title"],
+                "date": meeting["date"],
+                "duration": meeting["duration"],
+                "transcript_url": meeting.get("transcript_url"),
+                "audio_url": meeting.get("audio_url"),
+                "sentences": transcript_data.get("sentences") or [],
+                "summary": meeting.get("summary", {})
+            }
+            await self.save_json(
+                full_transcript,
+                os.path.join(meeting_dir, "transcript.json")
+            )
 
-    def download_all(self, output_dir="fireflies_downloads", start_date=None, end_date=None):
+        # Download audio, streaming straight to disk
+        audio_url = meeting.get("audio_url")
+        audio_ok = await self.download_to_file(
+            audio_url,
+            os.path.join(meeting_dir, "recording.mp3")
+        )
+
+        # metadata.json doubles as the completion marker for the rerun skip
+        # check, so it is written last and only once both the audio step
+        # (unless there was no audio to fetch) and the transcript fetch
+        # settled — a failure in either leaves the meeting pending
+        if not audio_ok and audio_url:
+            return
+        if transcript_data is _FETCH_FAILED:
+            return
+
+        metadata = {
+            "id": meeting["id"],
+            "title": meeting["title"],
+            "date": meeting["date"],
+            "duration": meeting["duration"],
+            "transcript_url": meeting.get("transcript_url"),
+            "audio_url": audio_url,
+            "summary": meeting.get("summary", {})
+        }
+        await self.save_json(metadata, os.path.join(meeting_dir, "metadata.json"))
+
+    async def download_all(self, output_dir="fireflies_downloads", start_date=None, end_date=None):
         """Download all meetings within the specified date range"""
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -179,7 +578,7 @@ class FirefliesDownloader:
             except ValueError:
                 print("Invalid start date format. Use YYYY-MM-DD")
                 return
-        
+
         if end_date:
             try:
                 datetime.strptime(end_date, '%Y-%m-%d')
@@ -188,94 +587,145 @@ class FirefliesDownloader:
                 return
 
         # Fetch all meetings
-        meetings = self.fetch_meetings(start_date, end_date)
-        
+        meetings = await self.fetch_meetings(start_date, end_date)
+
         if not meetings:
             print("No meetings found or error occurred while fetching meetings.")
             return
 
-        for meeting in meetings:
-            # Create meeting-specific directory
-            meeting_date = datetime.fromtimestamp(int(meeting["date"])/1000).strftime('%Y-%m-%d')
-            meeting_title = meeting["title"].replace("/", "-").replace("\\", "-")
-            meeting_dir = os.path.join(output_dir, f"{meeting_date}_{meeting_title}")
-            
-            # Get full transcript data
-            transcript_data = self.get_transcript(meeting["id"])
-            if transcript_data:
-                # Save transcript data
-                self.save_file(
-                    json.dumps(transcript_data, indent=2).encode('utf-8'),
-                    os.path.join(meeting_dir, "transcript.json")
-                )
-            
-            # Download and save audio
-            audio = self.download_file(meeting.get("audio_url"), "audio")
-            if audio:
-                self.save_file(audio, os.path.join(meeting_dir, "recording.mp3"))
-
-            # Save meeting metadata
-            metadata = {
-                "id": meeting["id"],
-                "title": meeting["title"],
-                "date": meeting["date"],
-                "duration": meeting["duration"],
-                "transcript_url": meeting.get("transcript_url"),
-                "audio_url": meeting.get("audio_url"),
-                "summary": meeting.get("summary", {})
-            }
-            self.save_file(
-                json.dumps(metadata, indent=2).encode('utf-8'),
-                os.path.join(meeting_dir, "metadata.json")
-            )
+        # Convert every meeting timestamp in one pass up front rather than
+        # re-deriving it inside each concurrent task
+        meeting_dates = [
+            datetime.fromtimestamp(int(meeting["date"]) / 1000).strftime('%Y-%m-%d')
+            for meeting in meetings
+        ]
 
-def main():
+        # Skip meetings that are fully downloaded from a previous run before
+        # spending any network traffic on them, and drop ids pagination
+        # overlap may have returned twice so no meeting is processed (and its
+        # audio downloaded) more than once
+        pending = []
+        seen_ids = set()
+        for meeting, meeting_date in zip(meetings, meeting_dates):
+            if meeting["id"] in seen_ids:
+                continue
+            seen_ids.add(meeting["id"])
+            meeting_dir = os.path.join(output_dir, f"{meeting_date}_{_sanitize(meeting['title'])}")
+            # A meeting without an audio_url can never produce recording.mp3,
+            # so for those the metadata marker alone means complete
+            audio_done = (not meeting.get("audio_url")
+                          or os.path.exists(os.path.join(meeting_dir, "recording.mp3")))
+            if os.path.exists(os.path.join(meeting_dir, "metadata.json")) and audio_done:
+                print(f"Already downloaded, skipping: {meeting_dir}")
+                continue
+            pending.append((meeting, meeting_dir))
+
+        if not pending:
+            print("All meetings already downloaded.")
+            return
+
+        # Fetch all transcripts in batched queries, then process concurrently
+        transcripts = await self.get_transcripts([meeting["id"] for meeting, _ in pending])
+        tasks = [
+            self._process_meeting(meeting, meeting_dir, transcripts.get(meeting["id"], _FETCH_FAILED))
+            for meeting, meeting_dir in pending
+        ]
+        await asyncio.gather(*tasks)
+
+async def run(args):
     print("Fireflies.ai Meeting Downloader")
     print("------------------------------")
-    
-    # Get API key from environment variable or user input
-    api_key = os.getenv("FIREFLIES_API_KEY")
+
+    # Get API key from flag, environment variable or prompt
+    api_key = args.api_key or os.getenv("FIREFLIES_API_KEY")
     if not api_key:
-        api_key = input("Enter your Fireflies.ai API key: ")
-    
+        api_key = getpass.getpass("Enter your Fireflies.ai API key: ")
+
     if not api_key.strip():
         print("Error: API key is required")
         return
 
     # Initialize downloader
-    downloader = FirefliesDownloader(api_key)
-
-    # Ask if user wants to download a specific transcript or all meetings
-    choice = input("Enter '1' to download a specific transcript, or '2' to download all meetings: ")
-    
-    if choice == '1':
-        transcript_id = input("Enter the transcript ID: ")
-        if transcript_id:
-            transcript_data = downloader.get_transcript(transcript_id)
+    async with FirefliesDownloader(
+        api_key,
+        max_concurrency=args.concurrency,
+        use_cache=not args.no_cache
+    ) as downloader:
+        if args.transcript_id:
+            transcript_data = await downloader.get_transcript(args.transcript_id)
             if transcript_data:
-                output_dir = "fireflies_downloads"
-                os.makedirs(output_dir, exist_ok=True)
-                meeting_title = transcript_data["title"].replace("/", "-").replace("\\", "-")
+                meeting_title = _sanitize(transcript_data["title"])
                 meeting_date = datetime.fromtimestamp(int(transcript_data["date"])/1000).strftime('%Y-%m-%d')
-                meeting_dir = os.path.join(output_dir, f"{meeting_date}_{meeting_title}")
-                
+                meeting_dir = os.path.join(args.output_dir, f"{meeting_date}_{meeting_title}")
+
                 # Save transcript data
-                downloader.save_file(
-                    json.dumps(transcript_data, indent=2).encode('utf-8'),
+                await downloader.save_json(
+                    transcript_data,
                     os.path.join(meeting_dir, "transcript.json")
                 )
                 print(f"Transcript saved to {meeting_dir}")
-    else:
-        # Optional date range
-        start_date = input("Enter start date (YYYY-MM-DD) or press Enter to skip: ")
-        end_date = input("Enter end date (YYYY-MM-DD) or press Enter to skip: ")
-
-        # Download all files
-        print("\nStarting download process...")
-        downloader.download_all(
-            start_date=start_date if start_date else None,
-            end_date=end_date if end_date else None
-        )
+        else:
+            start_date = args.start_date
+            end_date = args.end_date
+            # Only prompt for the optional date range when running
+            # interactively and no dates were given on the command line
+            if start_date is None and end_date is None and sys.stdin.isatty():
+                start_date = input("Enter start date (YYYY-MM-DD) or press Enter to skip: ") or None
+                end_date = input("Enter end date (YYYY-MM-DD) or press Enter to skip: ") or None
+
+            # Download all files
+            print("\nStarting download process...")
+            await downloader.download_all(
+                output_dir=args.output_dir,
+                start_date=start_date,
+                end_date=end_date
+            )
+
+def main():
+    parser = argparse.ArgumentParser(description="Download transcripts and audio from Fireflies.ai")
+    parser.add_argument(
+        "--api-key",
+        help="Fireflies.ai API key (default: FIREFLIES_API_KEY environment variable)"
+    )
+    parser.add_argument(
+        "--transcript-id",
+        help="Download a single transcript by ID instead of all meetings"
+    )
+    parser.add_argument(
+        "--start-date",
+        help="Only download meetings on or after this date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--end-date",
+        help="Only download meetings on or before this date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="fireflies_downloads",
+        help="Directory to save downloads into (default: fireflies_downloads)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of simultaneous HTTP requests (default: 8)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch transcripts from the API, ignoring the local cache"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging, including raw API responses"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(levelname)s %(message)s"
+    )
+    asyncio.run(run(args))
 
 if __name__ == "__main__":
     main()